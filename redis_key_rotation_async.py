@@ -0,0 +1,529 @@
+#!/usr/bin/env python
+"""
+Redis Enterprise Cluster Key Rotation Manager (asyncio variant)
+
+This module provides an AsyncRedisKeyManager class mirroring RedisKeyManager
+from redis_key_rotation_v18, built on redis.asyncio. The async cluster client
+multiplexes many in-flight commands over its connections, so concurrent
+callers (web handlers, batch loaders) amortize the network round-trip across
+tasks instead of blocking a thread per command.
+
+Usage:
+    from redis_key_rotation_async import AsyncRedisKeyManager
+
+    async def main():
+        redis_manager = await AsyncRedisKeyManager.create(
+            hostname="your-redis-cluster.azure.redis.cache.windows.net",
+            primary_key="your-primary-access-key",
+            secondary_key="your-secondary-access-key",
+            port=10000
+        )
+        await redis_manager.write_data("test:key", "Hello, Redis!")
+        value = await redis_manager.read_data("test:key")
+        await redis_manager.close()
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Optional, Any, Union
+
+import redis
+import redis.asyncio
+import redis.asyncio.cluster
+
+# uvloop (libuv-based event loop) batches socket syscalls internally and is
+# a drop-in replacement for the default loop; install it when present. On
+# Linux kernels >= 5.6, `pip install uvloop` is the easiest client-side
+# lever against recv/send syscall overhead.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class AsyncRedisKeyManager:
+    """
+    Async counterpart of RedisKeyManager with the same key-rotation failover.
+
+    Commands issued concurrently from multiple tasks share the client's
+    connections, so N in-flight operations cost far less than N sequential
+    round-trips. The primary/secondary rotation logic is identical to the
+    synchronous class.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        primary_key: str,
+        secondary_key: str,
+        port: int = 10000,  # Default to port 10000 for Redis Enterprise Cluster
+        ssl: bool = True,
+        db: int = 0,
+        socket_timeout: int = 5,
+        socket_connect_timeout: int = 5,
+        max_retries: int = 3,
+        cluster_mode: bool = True,  # Enable cluster mode by default for Redis Enterprise
+        decode_responses: bool = False,
+        max_connections: int = 64,
+        connection_class=None
+    ):
+        """
+        Initialize the async Redis connection manager.
+
+        Note that __init__ does not connect; either call `await connect()`
+        after construction or use the `create()` classmethod.
+
+        Args:
+            hostname: Redis hostname (e.g., 'myinstance.redis.cache.windows.net')
+            primary_key: Primary access key
+            secondary_key: Secondary access key
+            port: Redis port (default: 10000 for Redis Enterprise Cluster)
+            ssl: Whether to use SSL (default: True)
+            db: Redis database number (default: 0, non-cluster mode only)
+            socket_timeout: Socket timeout in seconds (default: 5)
+            socket_connect_timeout: Connection timeout in seconds (default: 5)
+            max_retries: Maximum number of retries for operations (default: 3)
+            cluster_mode: Whether to use the cluster client (default: True)
+            decode_responses: Decode replies to str instead of bytes (default: False)
+            max_connections: Connection budget so the event loop can keep
+                many commands in flight (default: 64)
+            connection_class: Optional redis.asyncio Connection subclass to
+                use as the transport, e.g. an io_uring-backed connection
+                that batches sends for pipeline flushes. Wired through an
+                explicit ConnectionPool; the class is responsible for its
+                own TLS handling (non-cluster mode only; default: None,
+                redis-py's standard transport)
+        """
+        self.hostname = hostname
+        self.primary_key = primary_key
+        self.secondary_key = secondary_key
+        self.port = port
+        self.ssl = ssl
+        self.db = db
+        self.socket_timeout = socket_timeout
+        self.socket_connect_timeout = socket_connect_timeout
+        self.max_retries = max_retries
+        self.cluster_mode = cluster_mode
+        self.decode_responses = decode_responses
+        self.max_connections = max_connections
+        self.connection_class = connection_class
+
+        self.client: Optional[Union[redis.asyncio.Redis,
+                                    redis.asyncio.cluster.RedisCluster]] = None
+        self.using_primary = True
+
+        # Rate-limit full topology re-discovery, same policy as the sync class
+        self._last_topology_refresh = 0.0
+        self._base_refresh_interval = 5.0
+        self._max_refresh_interval = 60.0
+        self._min_refresh_interval = self._base_refresh_interval
+
+        # Precomputed exponential backoff schedule (0.5s, 1s, 2s, ...)
+        self._backoff = tuple(0.5 * (2 ** i) for i in range(max_retries))
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> "AsyncRedisKeyManager":
+        """Construct a manager and establish the initial connection."""
+        manager = cls(*args, **kwargs)
+        await manager.connect()
+        return manager
+
+    async def connect(self, verify: bool = False) -> None:
+        """
+        Create a new Redis connection with the current active key.
+
+        Args:
+            verify: Issue a PING after construction to proactively check the
+                connection (default: False; cluster initialization already
+                contacts the nodes for CLUSTER SLOTS, and a failing first
+                command triggers the normal failover anyway)
+        """
+        key = self.primary_key if self.using_primary else self.secondary_key
+        key_type = "primary" if self.using_primary else "secondary"
+
+        try:
+            logger.info("Connecting to Redis Enterprise Cluster using %s key", key_type)
+
+            # Close existing connection if any
+            if self.client:
+                try:
+                    await self.client.aclose()
+                except Exception as e:
+                    logger.warning("Error closing existing Redis connection: %s", e)
+
+            # Connection parameters
+            connection_params = {
+                "host": self.hostname,
+                "port": self.port,
+                "password": key,
+                "ssl": self.ssl,
+                "socket_timeout": self.socket_timeout,
+                "socket_connect_timeout": self.socket_connect_timeout,
+                # Leave auto-pipelining enabled: a bounded pool of shared
+                # connections lets the event loop coalesce concurrent commands
+                "max_connections": self.max_connections,
+            }
+
+            if self.decode_responses:
+                connection_params["decode_responses"] = True
+
+            # Only use db parameter for non-cluster mode
+            if not self.cluster_mode:
+                connection_params["db"] = self.db
+                # single_connection_client would serialize all commands over
+                # one socket and defeat multiplexing
+                connection_params["single_connection_client"] = False
+
+            # Create connection based on cluster mode
+            if self.cluster_mode:
+                self.client = redis.asyncio.cluster.RedisCluster(**connection_params)
+                await self.client.initialize()
+            elif self.connection_class is not None:
+                # Redis() has no connection_class kwarg; a custom transport
+                # (e.g. io_uring-backed batching) is wired through an
+                # explicit ConnectionPool. The supplied class owns TLS, so
+                # the ssl and client-only flags stay out of the pool kwargs.
+                pool_params = {k: v for k, v in connection_params.items()
+                               if k not in ("ssl", "single_connection_client")}
+                pool = redis.asyncio.ConnectionPool(
+                    connection_class=self.connection_class, **pool_params)
+                self.client = redis.asyncio.Redis(connection_pool=pool)
+            else:
+                self.client = redis.asyncio.Redis(**connection_params)
+
+            # Only test the connection when explicitly asked; the extra PING
+            # is a redundant round-trip to a random node
+            if verify:
+                await self.client.ping()
+            self._last_topology_refresh = time.monotonic()
+            self._min_refresh_interval = self._base_refresh_interval
+            logger.info("Successfully connected to Redis Enterprise Cluster using %s key", key_type)
+        except (redis.exceptions.ConnectionError, redis.exceptions.AuthenticationError,
+                redis.exceptions.ResponseError) as e:
+            logger.error("Failed to connect with %s key: %s", key_type, e)
+            if self.using_primary:
+                logger.info("Switching to secondary key")
+                self.using_primary = False
+                await self.connect()
+            else:
+                logger.critical("Both primary and secondary keys failed to connect")
+                raise
+
+    async def _maybe_refresh_topology(self) -> bool:
+        """
+        Re-run connect() only if the refresh rate limit allows it.
+
+        Same policy as the synchronous class: refreshes are gated behind an
+        exponentially growing interval that resets once a refresh succeeds.
+
+        Returns:
+            bool: True if a refresh was performed, False if throttled
+        """
+        now = time.monotonic()
+        elapsed = now - self._last_topology_refresh
+        if elapsed <= self._min_refresh_interval:
+            logger.warning("Topology refresh throttled; retrying on existing pool "
+                           "(next refresh allowed in %.1fs)",
+                           self._min_refresh_interval - elapsed)
+            return False
+
+        try:
+            await self.connect()
+        except Exception:
+            # Back off harder on repeated refresh failures
+            self._min_refresh_interval = min(self._min_refresh_interval * 2,
+                                             self._max_refresh_interval)
+            raise
+        return True
+
+    async def _handle_retry(self, attempt: int, exc: Exception, refresh: bool = True) -> None:
+        """
+        Shared retry bookkeeping for execute_with_failover.
+
+        Args:
+            attempt: Zero-based retry attempt number
+            exc: The exception that triggered the retry
+            refresh: Whether to attempt a topology refresh (default: True)
+        """
+        retry_delay = self._backoff[attempt]
+        logger.info("Retrying in %.2f seconds... (attempt %d/%d)", retry_delay, attempt+1, self.max_retries)
+        await asyncio.sleep(retry_delay)
+
+        if refresh and attempt > 0:
+            await self._maybe_refresh_topology()
+
+    async def execute_with_failover(self, command_func, *args, **kwargs) -> Any:
+        """
+        Execute a Redis command with automatic failover to secondary key if needed.
+
+        Args:
+            command_func: The awaitable Redis command function to execute
+            *args: Arguments to pass to the command function
+            **kwargs: Keyword arguments to pass to the command function
+
+        Returns:
+            The result of the Redis command
+        """
+        for attempt in range(self.max_retries):
+            try:
+                return await command_func(*args, **kwargs)
+            except (redis.exceptions.ConnectionError, redis.exceptions.AuthenticationError,
+                    redis.exceptions.ResponseError) as e:
+                # Check if it's a CROSSSLOT error (common in cluster mode)
+                if isinstance(e, redis.exceptions.ResponseError) and "CROSSSLOT" in str(e):
+                    logger.error("CROSSSLOT error: %s. Keys in this operation must hash to the same slot.", e)
+                    raise  # CROSSSLOT errors can't be solved by key rotation, so raise immediately
+
+                # Check if it's an authentication error - which indicates key rotation has occurred
+                if (isinstance(e, redis.exceptions.AuthenticationError) or
+                    (isinstance(e, redis.exceptions.ResponseError) and
+                     ("NOAUTH" in str(e) or "invalid password" in str(e).lower()))):
+                    logger.warning("Authentication error detected: %s", e)
+
+                    # If using primary key, switch to secondary immediately
+                    if self.using_primary:
+                        logger.info("Primary key appears to have been rotated. Switching to secondary key")
+                        self.using_primary = False
+                        await self.connect()
+
+                        # Retry the command immediately with the new connection
+                        try:
+                            return await command_func(*args, **kwargs)
+                        except Exception as retry_e:
+                            logger.warning("Retry after key switch failed: %s", retry_e)
+                            # Continue to normal retry logic
+
+                # For other connection errors or if secondary key also failed
+                logger.warning("Connection error on attempt %d: %s", attempt+1, e)
+                if attempt < self.max_retries - 1:
+                    await self._handle_retry(attempt, e)
+            except redis.exceptions.TimeoutError as e:
+                logger.warning("Timeout error on attempt %d: %s", attempt+1, e)
+                if attempt < self.max_retries - 1:
+                    await self._handle_retry(attempt, e, refresh=False)
+                else:
+                    raise
+
+        # If we've exhausted all retries
+        raise redis.exceptions.ConnectionError("Failed to execute Redis command after multiple retries")
+
+    async def write_data_batch(self, items, expire: Optional[int] = None,
+                               batch_size: int = 256) -> int:
+        """
+        Write multiple key/value pairs to Redis using a pipelined batch.
+
+        Same slot-grouped pipelining as the synchronous class; see
+        RedisKeyManager.write_data_batch.
+
+        Args:
+            items: Iterable of (key, value) pairs to write
+            expire: Optional expiration time in seconds applied to every key
+            batch_size: Number of items to buffer before flushing (default: 256)
+
+        Returns:
+            int: Number of items written
+        """
+        if not self.client:
+            await self.connect()
+
+        if self.cluster_mode:
+            # Group keys by hash slot so each pipeline flush targets one slot
+            slot_groups = defaultdict(list)
+            for key, value in items:
+                slot_groups[self.client.keyslot(key)].append((key, value))
+            groups = slot_groups.values()
+        else:
+            groups = [list(items)]
+
+        written = 0
+        for group in groups:
+            for start in range(0, len(group), batch_size):
+                chunk = group[start:start + batch_size]
+
+                async def _flush(chunk=chunk):
+                    # Rebuild the pipeline on every attempt: execute()
+                    # resets the command stack even when it raises, so
+                    # retrying a prebuilt pipeline would execute nothing
+                    # and report the lost batch as written
+                    pipe = self.client.pipeline(transaction=False)
+                    for key, value in chunk:
+                        # SET EX carries the TTL in the same command
+                        pipe.set(key, value, ex=expire)
+                    return await pipe.execute()
+
+                await self.execute_with_failover(_flush)
+                written += len(chunk)
+
+        return written
+
+    async def write_data(self, key: str, value: str, expire: Optional[int] = None) -> bool:
+        """
+        Write data to Redis with automatic failover.
+
+        Args:
+            key: Redis key
+            value: Value to store
+            expire: Optional expiration time in seconds
+
+        Returns:
+            bool: Success status
+        """
+        if not self.client:
+            await self.connect()
+
+        async def _write():
+            # SET with ex= applies the TTL atomically in the same command
+            return await self.client.set(key, value, ex=expire)
+
+        return await self.execute_with_failover(_write)
+
+    async def read_data(self, key: str) -> Optional[Union[bytes, str]]:
+        """
+        Read data from Redis with automatic failover.
+
+        Args:
+            key: Redis key
+
+        Returns:
+            Value (bytes, or str if decode_responses is set) or None if not
+            found/error
+        """
+        if not self.client:
+            await self.connect()
+
+        async def _read():
+            # Re-resolve self.client per attempt so a reconnect during
+            # failover swaps in the fresh client
+            return await self.client.get(key)
+
+        return await self.execute_with_failover(_read)
+
+    async def delete_data(self, key: str) -> bool:
+        """
+        Delete data from Redis with automatic failover.
+
+        Args:
+            key: Redis key
+
+        Returns:
+            bool: Success status (True if key was deleted)
+        """
+        if not self.client:
+            await self.connect()
+
+        async def _delete():
+            # Re-resolve self.client per attempt, as in read_data
+            return await self.client.delete(key)
+
+        return bool(await self.execute_with_failover(_delete))
+
+    async def update_primary_key(self, new_primary_key: str) -> None:
+        """
+        Update the primary key (after rotation).
+
+        Validates the new key with an in-place AUTH on the existing client,
+        mirroring RedisKeyManager.update_primary_key.
+
+        Args:
+            new_primary_key: New primary access key
+        """
+        self.primary_key = new_primary_key
+        logger.info("Primary key has been updated")
+
+        # If we're currently using the secondary key, try switching back to primary
+        if not self.using_primary:
+            logger.info("Attempting to switch back to primary key")
+            try:
+                if self.cluster_mode:
+                    node = self.client.get_default_node()
+                    await self.client.execute_command("AUTH", new_primary_key,
+                                                      target_nodes=node)
+                    # Swap the password in each node's connection kwargs:
+                    # acquire_connection builds new connections from these,
+                    # so future connections authenticate with the rotated
+                    # key (mirrors the sync _switch_key approach)
+                    for cluster_node in self.client.get_nodes():
+                        cluster_node.connection_kwargs["password"] = new_primary_key
+                else:
+                    await self.client.execute_command("AUTH", new_primary_key)
+                    self.client.connection_pool.connection_kwargs["password"] = new_primary_key
+
+                self.using_primary = True
+                logger.info("Successfully switched back to primary key")
+            except (redis.exceptions.ConnectionError, redis.exceptions.AuthenticationError,
+                    redis.exceptions.ResponseError) as e:
+                # Fall back to a full reconnect only if the in-place AUTH failed
+                logger.warning("In-place AUTH with new primary key failed: %s. "
+                               "Falling back to a full reconnect", e)
+                try:
+                    self.using_primary = True
+                    await self.connect()
+                except (redis.exceptions.ConnectionError, redis.exceptions.AuthenticationError,
+                        redis.exceptions.ResponseError):
+                    logger.warning("New primary key validation failed, staying on secondary")
+
+    async def __aenter__(self) -> "AsyncRedisKeyManager":
+        if not self.client:
+            await self.connect()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the Redis connection and release pooled sockets."""
+        if self.client:
+            # Disconnect the pool explicitly so sockets are released now
+            # rather than whenever the GC gets to them (the cluster client
+            # closes its per-node connections inside aclose())
+            if not self.cluster_mode:
+                try:
+                    await self.client.connection_pool.disconnect()
+                except Exception as e:
+                    logger.warning("Error disconnecting connection pool: %s", e)
+            await self.client.aclose()
+            self.client = None
+            logger.info("Redis connection closed")
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+
+    async def main():
+        REDIS_HOST = os.getenv("REDIS_HOST", "your-redis-cluster.azure.redis.cache.windows.net")
+        PRIMARY_KEY = os.getenv("REDIS_PRIMARY_KEY", "your-primary-access-key")
+        SECONDARY_KEY = os.getenv("REDIS_SECONDARY_KEY", "your-secondary-access-key")
+
+        redis_manager = await AsyncRedisKeyManager.create(
+            hostname=REDIS_HOST,
+            primary_key=PRIMARY_KEY,
+            secondary_key=SECONDARY_KEY,
+            port=10000,
+            cluster_mode=True
+        )
+
+        try:
+            await redis_manager.write_data("test:key1", "Hello, Redis!")
+            value = await redis_manager.read_data("test:key1")
+            print(f"Retrieved value: {value}")
+
+            # Concurrent operations share the connection pool and amortize RTT
+            await asyncio.gather(*(
+                redis_manager.write_data(f"test:concurrent:{i}", f"value-{i}")
+                for i in range(100)
+            ))
+        finally:
+            await redis_manager.close()
+
+    asyncio.run(main())
@@ -25,12 +25,166 @@ Usage:
     redis_manager.update_primary_key("new-primary-key")
 """
 
+import itertools
 import redis
 import redis.cluster
+import redis.connection
 import logging
+import socket
+import threading
 import time
+from collections import defaultdict
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
 from typing import Optional, Any, Dict, Union
 
+# TCP keepalive probes detect half-open sockets silently dropped by
+# NATs/firewalls before a command stalls on them. The option names are
+# platform-dependent (TCP_KEEPIDLE is Linux-only), so only set what exists.
+_TCP_KEEPALIVE_OPTIONS = {
+    getattr(socket, opt): value
+    for opt, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 30), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, opt)
+}
+
+# Failure classification for execute_with_failover: a single dict lookup by
+# exception type replaces an isinstance cascade per failure, and the marker
+# tuples are built once instead of per attempt
+_AUTH_MARKERS = ("NOAUTH", "invalid password", "WRONGPASS")
+
+
+def _classify_auth_error(msg: str) -> str:
+    return "auth"
+
+
+def _classify_redirect_error(msg: str) -> str:
+    return "redirect"
+
+
+def _classify_clusterdown_error(msg: str) -> str:
+    return "clusterdown"
+
+
+def _classify_response_error(msg: str) -> str:
+    if "CROSSSLOT" in msg:
+        return "crossslot"
+    if any(marker in msg for marker in _AUTH_MARKERS):
+        return "auth"
+    return "connection"
+
+
+def _classify_connection_error(msg: str) -> str:
+    return "connection"
+
+
+def _classify_timeout_error(msg: str) -> str:
+    return "timeout"
+
+
+# Redirections and CLUSTERDOWN are classified by exception type: redis-py
+# strips the error-code token before building the exception, so str(e)
+# never starts with MOVED/ASK/CLUSTERDOWN. The MRO walk in
+# execute_with_failover picks the most-derived registered base.
+_ERR_CLASSIFIERS = {
+    redis.exceptions.AuthenticationError: _classify_auth_error,
+    redis.exceptions.MovedError: _classify_redirect_error,
+    redis.exceptions.AskError: _classify_redirect_error,
+    redis.exceptions.ClusterDownError: _classify_clusterdown_error,
+    redis.exceptions.ResponseError: _classify_response_error,
+    redis.exceptions.ConnectionError: _classify_connection_error,
+    redis.exceptions.TimeoutError: _classify_timeout_error,
+}
+
+
+class _AuthAwareRetry(Retry):
+    """
+    Retry policy that refuses to retry authentication failures.
+
+    AuthenticationError subclasses ConnectionError, so a plain Retry on
+    ConnectionError would re-send the same rotated-away password with
+    backoff max_retries times before the key-rotation logic in
+    execute_with_failover ever saw the failure.
+    """
+
+    def call_with_retry(self, do, fail, *args, **kwargs):
+        # Mirror the base signature and forward the extra arguments
+        # (is_retryable, with_failure_count, ...) untouched; newer redis-py
+        # calls this with with_failure_count=True, which also makes the
+        # failure hook receive (error, failure_count)
+        def _fail(error, *fail_args):
+            if isinstance(error, redis.exceptions.AuthenticationError):
+                raise error  # Surface immediately; key rotation handles it
+            return fail(error, *fail_args)
+
+        return super().call_with_retry(do, _fail, *args, **kwargs)
+
+
+class _RotatingCredentials:
+    """
+    Threadsafe primary/secondary credential pair shared by every connection.
+
+    Connections consult this object when they hit an authentication failure
+    so a key swap happens exactly once and is immediately visible pool-wide.
+    """
+
+    def __init__(self, primary_key: str, secondary_key: str):
+        self._lock = threading.Lock()
+        self.primary_key = primary_key
+        self.secondary_key = secondary_key
+        self.using_primary = True
+
+    @property
+    def active_key(self) -> str:
+        with self._lock:
+            return self.primary_key if self.using_primary else self.secondary_key
+
+    def rotate(self, failed_password: str) -> str:
+        """
+        Switch to the other key and return it.
+
+        The swap only happens if failed_password is still the active key, so
+        concurrent connections failing at the same time rotate once instead
+        of flapping back and forth.
+        """
+        with self._lock:
+            active = self.primary_key if self.using_primary else self.secondary_key
+            if failed_password == active:
+                self.using_primary = not self.using_primary
+                active = self.primary_key if self.using_primary else self.secondary_key
+            return active
+
+
+class RotatingSSLConnection(redis.connection.SSLConnection):
+    """
+    SSLConnection that swaps access keys inside the connection layer.
+
+    Normally an AUTH failure unwinds through Python-level failover code in
+    execute_with_failover. With this class, read_response detects the
+    AuthenticationError, swaps to the other key from the shared
+    _RotatingCredentials, and drops the socket; the pool's Retry policy then
+    reconnects with the new password and re-sends the command, so the
+    rotation never surfaces to command-level code.
+
+    The shared credential object is bound as a class attribute on a
+    per-manager subclass, so every connection in the pool consults the same
+    pair.
+    """
+
+    credentials: Optional[_RotatingCredentials] = None
+
+    def read_response(self, *args, **kwargs):
+        try:
+            return super().read_response(*args, **kwargs)
+        except redis.exceptions.AuthenticationError as e:
+            if self.credentials is None:
+                raise
+            logger.warning("Auth failure in connection layer; rotating key inline: %s", e)
+            self.password = self.credentials.rotate(self.password)
+            # Drop the socket so the retry reconnects (and re-AUTHs) with
+            # the swapped password before re-sending the command
+            self.disconnect()
+            raise
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -59,11 +213,14 @@ class RedisKeyManager:
         socket_connect_timeout: int = 5,
         max_retries: int = 3,
         retry_on_timeout: bool = True,
-        cluster_mode: bool = True  # Enable cluster mode by default for Redis Enterprise
+        cluster_mode: bool = True,  # Enable cluster mode by default for Redis Enterprise
+        decode_responses: bool = False,
+        max_connections: int = 32,
+        rotate_in_connection: bool = False
     ):
         """
         Initialize Redis connection manager with primary and secondary keys.
-        
+
         Args:
             hostname: Redis hostname (e.g., 'myinstance.redis.cache.windows.net')
             primary_key: Primary access key
@@ -75,6 +232,18 @@ class RedisKeyManager:
             socket_connect_timeout: Connection timeout in seconds (default: 5)
             max_retries: Maximum number of retries for operations (default: 3)
             retry_on_timeout: Whether to retry on timeout (default: True)
+            decode_responses: Decode replies to str instead of returning bytes
+                (default: False; decoding adds a UTF-8 pass over every value.
+                Install hiredis to get redis-py's C parser — the default
+                parser selection picks it up automatically)
+            max_connections: Per-pool connection cap; bounds file descriptors
+                and memory under load (default: 32, applied per node in
+                cluster mode)
+            rotate_in_connection: Swap keys inside the connection layer on
+                AUTH failures via RotatingSSLConnection, so rotation is
+                handled below execute_with_failover (default: False;
+                requires ssl=True and cluster_mode=False, since the cluster
+                client offers no hook for a custom connection class)
         """
         self.hostname = hostname
         self.primary_key = primary_key
@@ -87,27 +256,70 @@ class RedisKeyManager:
         self.max_retries = max_retries
         self.retry_on_timeout = retry_on_timeout
         self.cluster_mode = cluster_mode
-        
+        self.decode_responses = decode_responses
+        self.max_connections = max_connections
+
+        if rotate_in_connection and (cluster_mode or not ssl):
+            # The cluster client builds its own per-node clients and has no
+            # supported hook for a custom connection class
+            logger.warning("rotate_in_connection requires ssl=True and "
+                           "cluster_mode=False; disabling it")
+            rotate_in_connection = False
+        self.rotate_in_connection = rotate_in_connection
+
+        if self.rotate_in_connection:
+            # Shared credential pair consulted by every connection; bound as
+            # a class attribute on a per-manager subclass so it reaches the
+            # connections without threading a custom kwarg through the pool
+            self._credentials = _RotatingCredentials(primary_key, secondary_key)
+            self._rotating_connection_class = type(
+                "BoundRotatingSSLConnection",
+                (RotatingSSLConnection,),
+                {"credentials": self._credentials},
+            )
+
         self.client: Optional[Union[redis.Redis, redis.cluster.RedisCluster]] = None
         self.using_primary = True
-        
+
+        # Rate-limit full topology re-discovery (CLUSTER SLOTS is a slow
+        # query); the interval doubles on repeated failures up to a cap and
+        # resets once a refresh succeeds
+        self._last_topology_refresh = 0.0
+        self._base_refresh_interval = 5.0
+        self._max_refresh_interval = 60.0
+        self._min_refresh_interval = self._base_refresh_interval
+
+        # Precomputed backoff schedule for the outer retry loop; cluster
+        # node clients don't honor pool-level retry_on_error, so in cluster
+        # mode the backoff has to happen here
+        self._backoff = tuple(0.5 * (2 ** i) for i in range(max_retries))
+
+
         # Initialize connection with primary key
         self.connect()
     
-    def connect(self) -> None:
-        """Create a new Redis connection with the current active key."""
+    def connect(self, verify: bool = False) -> None:
+        """
+        Create a new Redis connection with the current active key.
+
+        Args:
+            verify: Issue a PING after construction to proactively check the
+                connection (default: False; cluster construction already
+                contacts the nodes for CLUSTER SLOTS, and a failing first
+                command triggers the normal failover anyway)
+        """
         key = self.primary_key if self.using_primary else self.secondary_key
         key_type = "primary" if self.using_primary else "secondary"
         
         try:
-            logger.info(f"Connecting to Redis Enterprise Cluster using {key_type} key")
+            logger.info("Connecting to Redis Enterprise Cluster using %s key", key_type)
             
             # Close existing connection if any
             if self.client:
                 try:
                     self.client.close()
                 except Exception as e:
-                    logger.warning(f"Error closing existing Redis connection: {e}")
+                    logger.warning("Error closing existing Redis connection: %s", e)
             
             # Connection parameters
             connection_params = {
@@ -118,9 +330,29 @@ class RedisKeyManager:
                 "socket_timeout": self.socket_timeout,
                 "socket_connect_timeout": self.socket_connect_timeout,
                 "retry_on_timeout": self.retry_on_timeout,
-                "decode_responses": True,  # Auto-decode responses to strings
+                # Transport-level retries with backoff run inside the
+                # connection layer for standalone clients. Auth failures are
+                # excluded so key rotation sees them immediately. Cluster
+                # node clients drop retry_on_error (filtered kwarg) and are
+                # forced to Retry(NoBackoff(), 0), so in cluster mode the
+                # outer loop in execute_with_failover does the backoff.
+                "retry": _AuthAwareRetry(ExponentialBackoff(cap=2.0, base=0.1),
+                                         self.max_retries),
+                "retry_on_error": [redis.exceptions.ConnectionError,
+                                   redis.exceptions.TimeoutError],
+                # Bound each pool (per node in cluster mode) and probe idle
+                # sockets so dead connections are noticed before use
+                "max_connections": self.max_connections,
+                "socket_keepalive": True,
+                "socket_keepalive_options": _TCP_KEEPALIVE_OPTIONS,
             }
-            
+
+            # Only decode replies when the caller asked for it; leaving values
+            # as bytes skips a Python-level decode on every reply
+            if self.decode_responses:
+                connection_params["decode_responses"] = True
+
+
             # Only use db parameter for non-cluster mode
             if not self.cluster_mode:
                 connection_params["db"] = self.db
@@ -128,15 +360,37 @@ class RedisKeyManager:
             # Create connection based on cluster mode
             if self.cluster_mode:
                 self.client = redis.cluster.RedisCluster(**connection_params)
+            elif self.rotate_in_connection:
+                # Redis() has no connection_class kwarg, so the rotating
+                # transport is wired through an explicit pool. The class is
+                # already SSL-based; the ssl flag must not be forwarded as
+                # a connection kwarg.
+                pool_params = {k: v for k, v in connection_params.items()
+                               if k != "ssl"}
+                # Unlike the standard client, this pool must retry auth
+                # failures at the transport level: the connection has
+                # already swapped to the other key when the error is
+                # raised, so the retry re-sends with the new password and
+                # the rotation stays below execute_with_failover
+                pool_params["retry"] = Retry(ExponentialBackoff(cap=2.0, base=0.1),
+                                             self.max_retries)
+                pool = redis.connection.ConnectionPool(
+                    connection_class=self._rotating_connection_class,
+                    **pool_params)
+                self.client = redis.Redis(connection_pool=pool)
             else:
                 self.client = redis.Redis(**connection_params)
             
-            # Test connection
-            self.client.ping()
-            logger.info(f"Successfully connected to Redis Enterprise Cluster using {key_type} key")
+            # Only test the connection when explicitly asked; the extra PING
+            # is a redundant round-trip to a random node
+            if verify:
+                self.client.ping()
+            self._last_topology_refresh = time.monotonic()
+            self._min_refresh_interval = self._base_refresh_interval
+            logger.info("Successfully connected to Redis Enterprise Cluster using %s key", key_type)
         except (redis.exceptions.ConnectionError, redis.exceptions.AuthenticationError,
                 redis.exceptions.ResponseError) as e:
-            logger.error(f"Failed to connect with {key_type} key: {e}")
+            logger.error("Failed to connect with %s key: %s", key_type, e)
             if self.using_primary:
                 logger.info("Switching to secondary key")
                 self.using_primary = False
@@ -145,15 +399,89 @@ class RedisKeyManager:
                 logger.critical("Both primary and secondary keys failed to connect")
                 raise
     
+    def _maybe_refresh_topology(self) -> bool:
+        """
+        Re-run connect() only if the refresh rate limit allows it.
+
+        Every connect() triggers a fresh CLUSTER SLOTS discovery; during an
+        outage, reconnecting on every retry would hammer the cluster with
+        slow queries. Refreshes are gated behind an exponentially growing
+        interval that resets once a refresh succeeds.
+
+        Returns:
+            bool: True if a refresh was performed, False if throttled
+        """
+        now = time.monotonic()
+        elapsed = now - self._last_topology_refresh
+        if elapsed <= self._min_refresh_interval:
+            logger.warning("Topology refresh throttled; retrying on existing pool "
+                           "(next refresh allowed in %.1fs)",
+                           self._min_refresh_interval - elapsed)
+            return False
+
+        try:
+            self.connect()
+        except Exception:
+            # Back off harder on repeated refresh failures
+            self._min_refresh_interval = min(self._min_refresh_interval * 2,
+                                             self._max_refresh_interval)
+            raise
+        return True
+
+    def _switch_key(self, new_password: str) -> bool:
+        """
+        Swap the active password on the existing pools without reconnecting.
+
+        Mutates connection_kwargs on every pool (per node in cluster mode)
+        and drops idle sockets so they re-authenticate with the new password
+        on next use. The topology map survives, so the swap costs none of
+        the CLUSTER SLOTS discovery or TLS handshakes a full connect() does.
+
+        Args:
+            new_password: Password to install on the pools
+
+        Returns:
+            bool: True if the in-place swap was applied, False if the caller
+            should fall back to a full connect()
+        """
+        if self.client is None:
+            return False
+
+        try:
+            if self.cluster_mode:
+                # Topology refreshes (nodes_manager.initialize, e.g. from
+                # the MOVED/ASK branch) rebuild node clients from the nodes
+                # manager's kwargs, so the new password must land there too
+                # or the next slot migration resurrects the dead key
+                self.client.nodes_manager.connection_kwargs["password"] = new_password
+                for cluster_node in self.client.get_nodes():
+                    if cluster_node.redis_connection is None:
+                        continue
+                    pool = cluster_node.redis_connection.connection_pool
+                    pool.connection_kwargs["password"] = new_password
+                    pool.disconnect(inuse_connections=False)
+            else:
+                pool = self.client.connection_pool
+                pool.connection_kwargs["password"] = new_password
+                pool.disconnect(inuse_connections=False)
+        except Exception as e:
+            logger.warning("In-place key switch failed: %s. Falling back to full reconnect", e)
+            return False
+        return True
+
     def execute_with_failover(self, command_func, *args, **kwargs) -> Any:
         """
         Execute a Redis command with automatic failover to secondary key if needed.
-        
+
+        Transport-level retries (with exponential backoff) are handled by the
+        connection pool's Retry policy; this layer only deals with key
+        rotation, cluster redirections, and last-resort topology refreshes.
+
         Args:
             command_func: The Redis command function to execute
             *args: Arguments to pass to the command function
             **kwargs: Keyword arguments to pass to the command function
-            
+
         Returns:
             The result of the Redis command
         """
@@ -161,67 +489,245 @@ class RedisKeyManager:
             try:
                 return command_func(*args, **kwargs)
             except (redis.exceptions.ConnectionError, redis.exceptions.AuthenticationError,
-                   redis.exceptions.ResponseError) as e:
-                # Check if it's a CROSSSLOT error (common in cluster mode)
-                if isinstance(e, redis.exceptions.ResponseError) and "CROSSSLOT" in str(e):
-                    logger.error(f"CROSSSLOT error: {e}. Keys in this operation must hash to the same slot.")
+                    redis.exceptions.ResponseError, redis.exceptions.TimeoutError) as e:
+                # Classify the failure with a single dict lookup (falling
+                # back along the MRO for subclasses) instead of an
+                # isinstance cascade with per-attempt substring scans
+                msg = str(e)
+                classifier = _ERR_CLASSIFIERS.get(type(e))
+                if classifier is None:
+                    classifier = _ERR_CLASSIFIERS[next(
+                        base for base in type(e).__mro__ if base in _ERR_CLASSIFIERS)]
+                action = classifier(msg)
+
+                if action == "crossslot":
+                    logger.error("CROSSSLOT error: %s. Keys in this operation must hash to the same slot.", e)
                     raise  # CROSSSLOT errors can't be solved by key rotation, so raise immediately
-                
-                # Check if it's an authentication error - which indicates key rotation has occurred
-                if (isinstance(e, redis.exceptions.AuthenticationError) or 
-                    (isinstance(e, redis.exceptions.ResponseError) and 
-                     ("NOAUTH" in str(e) or "invalid password" in str(e).lower()))):
-                    logger.warning(f"Authentication error detected: {e}")
-                    
-                    # If using primary key, switch to secondary immediately
+
+                # Cluster redirections and CLUSTERDOWN only need the slot map
+                # refreshed; a full reconnect (or key rotation) is wasted work
+                if action == "redirect":
+                    logger.warning("Cluster redirection on attempt %d: %s. Refreshing slot map", attempt+1, e)
+                    if self.cluster_mode and self.client is not None:
+                        self.client.nodes_manager.initialize()
+                    continue  # Re-execute against the refreshed slot map
+                if action == "clusterdown":
+                    logger.warning("Cluster reported down on attempt %d: %s", attempt+1, e)
+                    if attempt < self.max_retries - 1:
+                        # One rate-limited refresh recovers the whole
+                        # client once the cluster is healthy again
+                        self._maybe_refresh_topology()
+                    continue
+
+                if action == "timeout":
+                    if self.cluster_mode and attempt < self.max_retries - 1:
+                        # Cluster node clients run no pool-level retries;
+                        # back off here before trying again
+                        logger.warning("Timeout error on attempt %d: %s", attempt+1, e)
+                        time.sleep(self._backoff[attempt])
+                        continue
+                    logger.warning("Timeout error after pool-level retries: %s", e)
+                    raise
+
+                # An authentication error indicates key rotation has occurred
+                if action == "auth":
+                    logger.warning("Authentication error detected: %s", e)
+
+                    # If using primary key, switch to secondary immediately;
+                    # swapping the password on the existing pools keeps the
+                    # topology map instead of rebuilding the whole client
                     if self.using_primary:
                         logger.info("Primary key appears to have been rotated. Switching to secondary key")
                         self.using_primary = False
-                        self.connect()
-                        
-                        # Retry the command immediately with the new connection
+                        if not self._switch_key(self.secondary_key):
+                            self.connect()
+
+                        # Retry the command immediately with the new credentials
                         try:
                             return command_func(*args, **kwargs)
                         except Exception as retry_e:
-                            logger.warning(f"Retry after key switch failed: {retry_e}")
-                            # Continue to normal retry logic
-                    
-                # For other connection errors or if secondary key also failed
-                logger.warning(f"Connection error on attempt {attempt+1}: {e}")
-                if attempt < self.max_retries - 1:
-                    # Apply exponential backoff for retry
-                    retry_delay = 0.5 * (2 ** attempt)  # Exponential backoff
-                    logger.info(f"Retrying in {retry_delay:.2f} seconds... (attempt {attempt+1}/{self.max_retries})")
-                    time.sleep(retry_delay)
-                    
-                    # Reconnect before retrying
-                    self.connect()
-            except redis.exceptions.TimeoutError as e:
-                logger.warning(f"Timeout error on attempt {attempt+1}: {e}")
+                            logger.warning("Retry after key switch failed: %s", retry_e)
+                            # The cheap swap wasn't enough; rebuild the client
+                            # before falling through to the normal retry logic
+                            self.connect()
+
+                # For other connection errors or if secondary key also failed.
+                # Standalone clients have already retried with backoff at the
+                # transport level; cluster node clients have not, so sleep
+                # the schedule there before the rate-limited refresh
+                logger.warning("Connection error on attempt %d: %s", attempt+1, e)
                 if attempt < self.max_retries - 1:
-                    time.sleep(0.5 * (2 ** attempt))  # Exponential backoff
-                else:
-                    raise
+                    if self.cluster_mode:
+                        time.sleep(self._backoff[attempt])
+                    self._maybe_refresh_topology()
         
         # If we've exhausted all retries
         raise redis.exceptions.ConnectionError("Failed to execute Redis command after multiple retries")
     
-    def write_data_continuously(self, key_prefix: str, start_id: int = 0, 
+    def write_data_batch(self, items, expire: Optional[int] = None,
+                         batch_size: int = 256) -> int:
+        """
+        Write multiple key/value pairs to Redis using a pipelined batch.
+
+        Commands are buffered into a pipeline and flushed with a single
+        execute() every batch_size items, so the number of network round-trips
+        scales with the number of batches rather than the number of keys.
+        In cluster mode, keys are grouped by hash slot before pipelining to
+        avoid CROSSSLOT errors.
+
+        Args:
+            items: Iterable of (key, value) pairs to write
+            expire: Optional expiration time in seconds applied to every key
+            batch_size: Number of items to buffer before flushing (default: 256)
+
+        Returns:
+            int: Number of items written
+        """
+        if not self.client:
+            self.connect()
+
+        if self.cluster_mode:
+            # Group keys by hash slot so each pipeline flush targets one slot
+            slot_groups = defaultdict(list)
+            for key, value in items:
+                slot_groups[self.client.keyslot(key)].append((key, value))
+            groups = slot_groups.values()
+        else:
+            groups = [list(items)]
+
+        written = 0
+        for group in groups:
+            for start in range(0, len(group), batch_size):
+                chunk = group[start:start + batch_size]
+
+                def _flush(chunk=chunk):
+                    # Rebuild the pipeline on every attempt: execute()
+                    # resets the command stack even when it raises, so
+                    # retrying a prebuilt pipeline would execute nothing
+                    # and report the lost batch as written
+                    pipe = self.client.pipeline(transaction=False)
+                    for key, value in chunk:
+                        # SET EX carries the TTL in the same command
+                        pipe.set(key, value, ex=expire)
+                    return pipe.execute()
+
+                self.execute_with_failover(_flush)
+                written += len(chunk)
+
+        return written
+
+    def write_many(self, mapping) -> bool:
+        """
+        Write multiple key/value pairs using one MSET per hash slot.
+
+        In cluster mode, keys are grouped by slot and one MSET per slot is
+        issued through a single pipeline, collapsing N round-trips into
+        roughly one per shard.
+
+        Args:
+            mapping: Dict (or iterable of pairs) of key -> value
+
+        Returns:
+            bool: True if all MSETs succeeded
+        """
+        if not self.client:
+            self.connect()
+
+        mapping = dict(mapping)
+        if not mapping:
+            return True
+
+        if self.cluster_mode:
+            # Group keys by hash slot so each MSET targets a single slot
+            slot_groups = defaultdict(dict)
+            for key, value in mapping.items():
+                slot_groups[self.client.keyslot(key)][key] = value
+
+            def _flush():
+                # Rebuild the pipeline on every attempt: execute() resets
+                # the command stack even when it raises, so a retried
+                # prebuilt pipeline would run nothing and report success
+                pipe = self.client.pipeline(transaction=False)
+                for slot_mapping in slot_groups.values():
+                    pipe.mset(slot_mapping)
+                return pipe.execute()
+
+            return all(self.execute_with_failover(_flush))
+
+        def _mset():
+            # Re-resolve self.client per attempt, as in read_data
+            return self.client.mset(mapping)
+
+        return bool(self.execute_with_failover(_mset))
+
+    def read_many(self, keys) -> Dict[str, Optional[Union[bytes, str]]]:
+        """
+        Read multiple keys using one MGET per hash slot instead of per-key GETs.
+
+        In cluster mode, keys are grouped by slot and one MGET per slot is
+        issued through a single pipeline, collapsing N round-trips into
+        roughly one per shard.
+
+        Args:
+            keys: Iterable of Redis keys
+
+        Returns:
+            dict: Mapping of key -> value (None for keys that do not exist)
+        """
+        if not self.client:
+            self.connect()
+
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        if self.cluster_mode:
+            # Group keys by hash slot so each MGET targets a single slot
+            slot_groups = defaultdict(list)
+            for key in keys:
+                slot_groups[self.client.keyslot(key)].append(key)
+
+            ordered_keys = [key for slot_keys in slot_groups.values()
+                            for key in slot_keys]
+
+            def _fetch():
+                # Rebuild the pipeline on every attempt: execute() resets
+                # the command stack even when it raises, so a retried
+                # prebuilt pipeline would return an empty result set
+                pipe = self.client.pipeline(transaction=False)
+                for slot_keys in slot_groups.values():
+                    pipe.mget(slot_keys)
+                return pipe.execute()
+
+            results = self.execute_with_failover(_fetch)
+            return dict(zip(ordered_keys, itertools.chain.from_iterable(results)))
+
+        def _mget():
+            # Re-resolve self.client per attempt, as in read_data
+            return self.client.mget(keys)
+
+        values = self.execute_with_failover(_mget)
+        return dict(zip(keys, values))
+
+    def write_data_continuously(self, key_prefix: str, start_id: int = 0,
                             count: int = 100, interval: float = 0.5,
-                            callback=None):
+                            callback=None, batch_size: int = 256):
         """
         Continuously write data to Redis, handling key rotation automatically.
-        
-        This method will write data in a loop, and will automatically switch to the
-        secondary key if the primary key is rotated in the Azure portal.
-        
+
+        Writes are buffered and flushed as pipelined batches of up to
+        batch_size items, and will automatically switch to the secondary key
+        if the primary key is rotated in the Azure portal. The interval sleep
+        is applied between batches, not between individual items.
+
         Args:
             key_prefix: Prefix for Redis keys
             start_id: Starting ID for the data
             count: Number of writes to perform
-            interval: Time between writes in seconds
-            callback: Optional callback function(id, success, using_primary) called after each write
-            
+            interval: Time between batches in seconds
+            callback: Optional callback function(id, success, using_primary) called after each batch
+            batch_size: Number of writes to buffer before flushing (default: 256)
+
         Returns:
             dict: Statistics about the operation (total, successful, failed, using_primary)
         """
@@ -230,44 +736,84 @@ class RedisKeyManager:
             "successful": 0,
             "failed": 0,
             "key_switches": 0,
+            "drift_ms": 0.0,
             "final_key": "primary" if self.using_primary else "secondary"
         }
-        
-        logger.info(f"Starting continuous write operation: {count} items, interval {interval}s")
-        
+
+        logger.info("Starting continuous write operation: %d items, "
+                    "batch size %d, interval %ss", count, batch_size, interval)
+
+        # Build keys/values as raw bytes with the prefix encoded once; str
+        # formatting per item is surprisingly hot in tight loops, and bytes
+        # go straight to the wire without a per-item encode
+        prefix = key_prefix.encode() + b":"
+        _time = time.time  # Local binding skips the module attribute lookup
+
+        # Bind the per-item and per-batch callables as locals too; attribute
+        # lookups through self add up inside the hot loop
+        buffer = []
+        append = buffer.append
+        write_batch = self.write_data_batch
+
+        # Per-batch success logging drops to DEBUG and is gated on the level
+        # so the format arguments are never even assembled on the common
+        # path; key switches and failures stay loud
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        _log_debug = logger.debug
+
+        # Pace batches against a monotonic deadline rather than sleeping a
+        # flat interval: when a flush runs long the loop catches up instead
+        # of silently stretching the effective interval
+        next_deadline = time.monotonic()
+
         for i in range(start_id, start_id + count):
-            key = f"{key_prefix}:{i}"
-            value = f"data-{i}-{time.time()}"
-            
-            # Track if we were using primary key before this operation
+            append((prefix + b"%d" % i, b"data-%d-%f" % (i, _time())))
+
+            # Keep buffering until the batch is full or this is the last item
+            if len(buffer) < batch_size and i < start_id + count - 1:
+                continue
+
+            # Track if we were using primary key before this batch
             was_using_primary = self.using_primary
-            
+
             try:
-                success = self.write_data(key, value)
-                stats["successful"] += 1
-                logger.info(f"Write {i} succeeded using {'primary' if self.using_primary else 'secondary'} key")
-                
-                # If we switched keys during this operation
+                write_batch(buffer, batch_size=batch_size)
+                stats["successful"] += len(buffer)
+                if debug_enabled:
+                    _log_debug("Batch of %d writes ending at %d succeeded using %s key",
+                               len(buffer), i,
+                               "primary" if self.using_primary else "secondary")
+
+                # If we switched keys during this batch
                 if was_using_primary != self.using_primary:
                     stats["key_switches"] += 1
-                    logger.warning(f"Key switch detected during operation {i}: "
-                                 f"primary → secondary")
+                    logger.warning("Key switch detected during batch ending at %d: "
+                                   "primary → secondary", i)
             except Exception as e:
-                stats["failed"] += 1
-                logger.error(f"Write {i} failed: {e}")
-            
-            stats["total"] += 1
-            
+                stats["failed"] += len(buffer)
+                logger.error("Batch of %d writes ending at %d failed: %s",
+                             len(buffer), i, e)
+
+            stats["total"] += len(buffer)
+            buffer.clear()  # Keep the list (and its bound append) alive
+
             # Call the callback if provided
             if callback:
                 callback(i, stats["successful"] > stats["failed"], self.using_primary)
-            
-            # Sleep before next write unless this is the last iteration
+
+            # Sleep until the next deadline unless this is the last iteration
             if i < start_id + count - 1:
-                time.sleep(interval)
-        
+                next_deadline += interval
+                delay = next_deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Flush overran the interval; record the lateness and
+                    # continue immediately to catch up
+                    stats["drift_ms"] += -delay * 1000.0
+
         stats["final_key"] = "primary" if self.using_primary else "secondary"
-        logger.info(f"Continuous write operation completed: {stats}")
+        logger.info("Continuous write operation completed: %s", stats)
         return stats
     
     def write_data(self, key: str, value: str, expire: Optional[int] = None) -> bool:
@@ -284,29 +830,36 @@ class RedisKeyManager:
         """
         if not self.client:
             self.connect()
-            
+
         def _write():
-            result = self.client.set(key, value)
-            if expire is not None:
-                self.client.expire(key, expire)
-            return result
-            
+            # SET with ex= applies the TTL atomically in the same command:
+            # one round-trip instead of two, and no window where the key
+            # exists without its TTL. self.client is re-resolved per attempt
+            # so a reconnect during failover swaps in the fresh client
+            return self.client.set(key, value, ex=expire)
+
         return self.execute_with_failover(_write)
     
-    def read_data(self, key: str) -> Optional[str]:
+    def read_data(self, key: str) -> Optional[Union[bytes, str]]:
         """
         Read data from Redis with automatic failover.
-        
+
         Args:
             key: Redis key
-            
+
         Returns:
-            Value or None if not found/error
+            Value (bytes, or str if decode_responses is set) or None if not
+            found/error
         """
         if not self.client:
             self.connect()
-            
-        return self.execute_with_failover(self.client.get, key)
+
+        def _read():
+            # Re-resolve self.client per attempt so a reconnect during
+            # failover swaps in the fresh client
+            return self.client.get(key)
+
+        return self.execute_with_failover(_read)
     
     def delete_data(self, key: str) -> bool:
         """
@@ -320,8 +873,12 @@ class RedisKeyManager:
         """
         if not self.client:
             self.connect()
-            
-        return bool(self.execute_with_failover(self.client.delete, key))
+
+        def _delete():
+            # Re-resolve self.client per attempt, as in read_data
+            return self.client.delete(key)
+
+        return bool(self.execute_with_failover(_delete))
     
     def update_primary_key(self, new_primary_key: str) -> None:
         """
@@ -336,76 +893,117 @@ class RedisKeyManager:
         old_primary = self.primary_key
         self.primary_key = new_primary_key
         logger.info("Primary key has been updated")
-        
+
         # If we're currently using the secondary key, try switching back to primary
         if not self.using_primary:
             logger.info("Attempting to switch back to primary key")
-            temp_client = None
             try:
-                # Test the new primary key
+                # Validate the new key with an AUTH on the existing client
+                # instead of building a throwaway one, which would run a full
+                # CLUSTER SLOTS discovery (and a second one on reconnect)
                 if self.cluster_mode:
-                    temp_client = redis.cluster.RedisCluster(
-                        host=self.hostname,
-                        port=self.port,
-                        password=new_primary_key,
-                        ssl=self.ssl,
-                        socket_timeout=self.socket_timeout,
-                        socket_connect_timeout=self.socket_connect_timeout
-                    )
+                    node = self.client.get_default_node()
+                    self.client.execute_command("AUTH", new_primary_key,
+                                                target_nodes=node)
                 else:
-                    temp_client = redis.Redis(
-                        host=self.hostname,
-                        port=self.port,
-                        password=new_primary_key,
-                        db=self.db,
-                        ssl=self.ssl,
-                        socket_timeout=self.socket_timeout,
-                        socket_connect_timeout=self.socket_connect_timeout
-                    )
-                temp_client.ping()
-                
-                # If successful, switch back to primary
+                    self.client.execute_command("AUTH", new_primary_key)
+
+                # If successful, install the rotated key on the existing
+                # pools; only rebuild the client if the swap isn't possible
                 self.using_primary = True
-                self.connect()
+                if not self._switch_key(new_primary_key):
+                    self.connect()
                 logger.info("Successfully switched back to primary key")
-            except (redis.exceptions.ConnectionError, redis.exceptions.AuthenticationError, 
-                    redis.exceptions.ResponseError):
-                logger.warning("New primary key validation failed, staying on secondary")
-            finally:
-                if temp_client:
-                    temp_client.close()
+            except (redis.exceptions.ConnectionError, redis.exceptions.AuthenticationError,
+                    redis.exceptions.ResponseError) as e:
+                # Fall back to a full reconnect only if the in-place AUTH failed
+                logger.warning("In-place AUTH with new primary key failed: %s. "
+                               "Falling back to a full reconnect", e)
+                try:
+                    self.using_primary = True
+                    self.connect()
+                except (redis.exceptions.ConnectionError, redis.exceptions.AuthenticationError,
+                        redis.exceptions.ResponseError):
+                    logger.warning("New primary key validation failed, staying on secondary")
 
 
+    def __enter__(self) -> "RedisKeyManager":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self):
+        # Last-resort cleanup if the caller forgot close(); a finalizer must
+        # never raise
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def close(self) -> None:
-        """Close the Redis connection."""
+        """Close the Redis connection and release pooled sockets."""
         if self.client:
+            # Disconnect the pools explicitly so sockets are released now
+            # rather than whenever the GC gets to them
+            try:
+                if self.cluster_mode:
+                    for cluster_node in self.client.get_nodes():
+                        if cluster_node.redis_connection is not None:
+                            cluster_node.redis_connection.connection_pool.disconnect()
+                else:
+                    self.client.connection_pool.disconnect()
+            except Exception as e:
+                logger.warning("Error disconnecting connection pool: %s", e)
             self.client.close()
             self.client = None
             logger.info("Redis connection closed")
-    
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+
+    # Get Redis credentials from environment variables or use defaults for demo
+    REDIS_HOST = os.getenv("REDIS_HOST", "your-redis-cluster.azure.redis.cache.windows.net")
+    PRIMARY_KEY = os.getenv("REDIS_PRIMARY_KEY", "your-primary-access-key")
+    SECONDARY_KEY = os.getenv("REDIS_SECONDARY_KEY", "your-secondary-access-key")
+
+    # Create the Redis manager for Redis Enterprise Cluster (port 10000)
+    redis_manager = RedisKeyManager(
+        hostname=REDIS_HOST,
+        primary_key=PRIMARY_KEY,
+        secondary_key=SECONDARY_KEY,
+        port=10000,
+        cluster_mode=True  # Enable cluster mode for Redis Enterprise
+    )
+
     try:
         # Example of writing data
         redis_manager.write_data("test:key1", "Hello, Redis!")
-        
+
         # Read the data back
         value = redis_manager.read_data("test:key1")
         print(f"Retrieved value: {value}")
-        
+
+        # Write a batch of data through a single pipeline flush
+        redis_manager.write_data_batch([(f"test:batch:{i}", f"value-{i}") for i in range(10)])
+
         # Simulate a key rotation scenario
         print("\nSimulating primary key rotation...")
-        
+
         # This would fail with the original primary key
         redis_manager.primary_key = "intentionally-invalid-key"
         redis_manager.using_primary = True
-        
+
         # The write operation should automatically fail over to the secondary key
         success = redis_manager.write_data("test:key2", "Using secondary key now!")
         print(f"Write with failover successful: {success}")
-        
+
         # Later, when you've rotated the primary key in Azure Portal
         NEW_PRIMARY_KEY = "your-new-primary-key-after-rotation"
         redis_manager.update_primary_key(NEW_PRIMARY_KEY)
-        
+
     finally:
         # Clean up
         redis_manager.close()